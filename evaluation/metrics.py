@@ -1,12 +1,31 @@
 # evaluation/metrics.py
 
 from typing import List, Dict
+from functools import lru_cache
 import re
 
+import numpy as np
+
+# ASCII bytes pattern: avoids Unicode character classes on the hot path
+_NORM_RE = re.compile(rb"[^a-zA-Z0-9 ]")
+
+# Only short texts (e.g. expected answers) are memoized
+_NORM_CACHE_MAX_LEN = 2048
+
+
+def _normalize(text: str) -> str:
+    raw = text.lower().encode("ascii", "ignore")
+    return _NORM_RE.sub(b"", raw).decode("ascii").strip()
+
+
+_normalize_cached = lru_cache(maxsize=4096)(_normalize)
+
 
 def normalize(text: str) -> str:
     """Simple text normalization"""
-    return re.sub(r"[^a-zA-Z0-9 ]", "", text.lower()).strip()
+    if len(text) < _NORM_CACHE_MAX_LEN:
+        return _normalize_cached(text)
+    return _normalize(text)
 
 
 def compute_retrieval_metrics(retrieved_docs: List[Dict], expected_sources: List[str]) -> float:
@@ -22,23 +41,28 @@ def compute_retrieval_metrics(retrieved_docs: List[Dict], expected_sources: List
         for doc in retrieved_docs
     ]
 
-    hits = 0
-    for src in expected_sources:
-        for r in retrieved_sources:
-            if src in r:
-                hits += 1
-                break
+    if not retrieved_sources:
+        return 0.0
+
+    # one substring scan per expected source over a pre-joined buffer
+    joined = "\0".join(retrieved_sources)
+    hits = sum(1 for src in expected_sources if src in joined)
 
     return hits / len(expected_sources)
 
 
-def compute_answer_metrics(answer: str, expected_answer: str) -> float:
+def compute_answer_metrics(answer: str, expected_answer: str, embedder=None) -> float:
     """
-    Simple semantic overlap metric (baseline version)
+    Semantic similarity between answer and expected answer.
+    Uses embedding cosine similarity if embedder is given,
+    otherwise falls back to token overlap (baseline version)
     """
     if not expected_answer:
         return 1.0
 
+    if embedder is not None:
+        return compute_answer_similarities([answer], [expected_answer], embedder)[0]
+
     a = normalize(answer)
     e = normalize(expected_answer)
 
@@ -52,6 +76,38 @@ def compute_answer_metrics(answer: str, expected_answer: str) -> float:
     return len(overlap) / len(e_tokens)
 
 
+def compute_answer_similarities(
+    answers: List[str],
+    expected_answers: List[str],
+    embedder
+) -> List[float]:
+    """
+    Batched cosine similarity between answers and expected answers.
+    All texts are encoded in a single embed_documents call.
+    Score: 0..1
+    """
+    if not answers:
+        return []
+
+    n = len(answers)
+    vectors = np.asarray(
+        embedder.embed_documents(list(answers) + list(expected_answers)),
+        dtype=np.float32
+    )
+    a, e = vectors[:n], vectors[n:]
+
+    norms = np.linalg.norm(a, axis=1) * np.linalg.norm(e, axis=1)
+    dots = np.einsum("nd,nd->n", a, e)
+    cosine = np.divide(dots, norms, out=np.zeros(n, dtype=np.float32), where=norms > 0)
+
+    scores = np.clip(cosine, 0.0, 1.0)
+    # empty ground truth → neutral score, empty answer → 0
+    return [
+        1.0 if not expected else (0.0 if not answer else round(float(score), 3))
+        for answer, expected, score in zip(answers, expected_answers, scores)
+    ]
+
+
 def compute_rag_quality_score(retrieval_score: float, answer_score: float) -> float:
     """
     Global RAG quality score
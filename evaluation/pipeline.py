@@ -1,29 +1,77 @@
 # evaluation/pipeline.py
 
-import json
+import asyncio
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.rag_pipeline import build_rag_chain, run_rag_query
+import orjson
+
+from src.rag_pipeline import build_rag_chain, arun_rag_query
 from src.embeddings import load_vectorstore
 
 from evaluation.metrics import (
     compute_retrieval_metrics,
-    compute_answer_metrics,
+    compute_answer_similarities,
     compute_rag_quality_score
 )
-from evaluation.retrieval_eval import evaluate_retrieval
+from evaluation.retrieval_eval import evaluate_retrieval_batch
 
 # Paths
 EVAL_DATASET_PATH = Path("evaluation/eval_dataset.json")
 REPORTS_DIR = Path("evaluation/reports")
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-
-def run_evaluation() -> List[Dict]:
+# Max concurrent LLM requests (provider rate limits)
+MAX_CONCURRENCY = 16
+
+
+async def _gather_rag_answers(
+    rag_chain,
+    questions: List[str],
+    max_concurrency: int = MAX_CONCURRENCY
+) -> Tuple[List[Dict[str, Any]], List[Optional[str]]]:
+    """
+    Dispatch RAG queries concurrently, bounded by a semaphore
+    Returns (answers, errors); failed requests get an empty answer and their error message
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _query(question: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await arun_rag_query(rag_chain, question)
+
+    outcomes = await asyncio.gather(
+        *(_query(q) for q in questions),
+        return_exceptions=True
+    )
+
+    # failed requests не зупиняють evaluation, але мають бути видимі
+    answers: List[Dict[str, Any]] = []
+    errors: List[Optional[str]] = []
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            answers.append({"answer": "", "sources": []})
+            errors.append(f"{type(outcome).__name__}: {outcome}")
+        else:
+            answers.append(outcome)
+            errors.append(None)
+
+    failed = [(q, e) for q, e in zip(questions, errors) if e is not None]
+    if failed:
+        print(f"WARNING: {len(failed)}/{len(questions)} RAG requests failed (scored as empty answers)")
+        for question, error in failed:
+            print(f"  - {question!r}: {error}")
+
+    return answers, errors
+
+
+async def arun_evaluation(retrieval_backend: str = "chroma") -> List[Dict]:
+    """
+    retrieval_backend: "chroma" (default) or "faiss" for batched retrieval
+    """
     # 1. Завантаження eval dataset
-    with open(EVAL_DATASET_PATH, "r", encoding="utf-8") as f:
-        dataset_json = json.load(f)
+    with open(EVAL_DATASET_PATH, "rb") as f:
+        dataset_json = orjson.loads(f.read())
 
     eval_dataset = dataset_json.get("samples", [])
     print(f"Loaded {len(eval_dataset)} evaluation examples")
@@ -32,23 +80,41 @@ def run_evaluation() -> List[Dict]:
     vectorstore = load_vectorstore()
     rag_chain = build_rag_chain(vectorstore)
 
+    # 3. Batch retrieval для всіх питань одразу
+    questions = [item.get("question", "") for item in eval_dataset]
+    retrieved_batch = evaluate_retrieval_batch(
+        questions,
+        vectorstore=vectorstore,
+        backend=retrieval_backend
+    )
+
+    # 4. Конкурентні LLM запити
+    rag_answers, rag_errors = await _gather_rag_answers(rag_chain, questions)
+
+    # 5. Semantic answer scores одним embed_documents викликом
+    answer_scores = compute_answer_similarities(
+        [a["answer"] for a in rag_answers],
+        [item.get("expected_answer", "") for item in eval_dataset],
+        embedder=vectorstore._embedding_function
+    )
+
     results = []
 
-    # 3. Проходимо по кожному прикладу
+    # 6. Проходимо по кожному прикладу
     for idx, item in enumerate(eval_dataset, start=1):
         question = item.get("question", "")
         expected_answer = item.get("expected_answer", "")
         expected_sources = item.get("expected_sources", [])
 
         # Retrieval
-        retrieved_docs = evaluate_retrieval(question, vectorstore=vectorstore)
+        retrieved_docs = retrieved_batch[idx - 1]
 
         # RAG answer
-        rag_answer = run_rag_query(rag_chain, question)
+        rag_answer = rag_answers[idx - 1]
 
         # Метрики
         retrieval_score = compute_retrieval_metrics(retrieved_docs, expected_sources)
-        answer_score = compute_answer_metrics(rag_answer, expected_answer)
+        answer_score = answer_scores[idx - 1]
         rag_quality = compute_rag_quality_score(retrieval_score, answer_score)
 
         results.append({
@@ -56,6 +122,7 @@ def run_evaluation() -> List[Dict]:
             "question": question,
             "expected_answer": expected_answer,
             "rag_answer": rag_answer,
+            "error": rag_errors[idx - 1],
             "retrieved_docs": retrieved_docs,
             "retrieval_score": retrieval_score,
             "answer_score": answer_score,
@@ -64,16 +131,24 @@ def run_evaluation() -> List[Dict]:
 
         print(f"[{idx}/{len(eval_dataset)}] Question processed")
 
-    # 4. Збереження результатів
+    # 7. Збереження результатів
     report_path = REPORTS_DIR / "eval_results.json"
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(report_path, "wb") as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-    print(f"Evaluation finished. {len(results)} samples processed.")
+    n_failed = sum(1 for e in rag_errors if e is not None)
+    print(f"Evaluation finished. {len(results)} samples processed, {n_failed} failed.")
     print(f"Results saved to {report_path}")
 
     return results
 
 
+def run_evaluation(retrieval_backend: str = "chroma") -> List[Dict]:
+    """
+    Sync entry point; use `await arun_evaluation()` inside a running event loop (e.g. Jupyter)
+    """
+    return asyncio.run(arun_evaluation(retrieval_backend))
+
+
 if __name__ == "__main__":
     run_evaluation()
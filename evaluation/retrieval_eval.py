@@ -1,5 +1,14 @@
 from typing import List, Dict
-from src.embeddings import load_vectorstore
+from src.embeddings import load_vectorstore, faiss_from_chroma, faiss_batch_search
+
+
+def _to_result(page_content: str, metadata: Dict) -> Dict:
+    metadata = metadata or {}
+    return {
+        "page_content": page_content,
+        "metadata": metadata,
+        "source": metadata.get("source") or metadata.get("image_url") or ""
+    }
 
 
 def evaluate_retrieval(question: str, vectorstore=None, k: int = 5) -> List[Dict]:
@@ -14,10 +23,50 @@ def evaluate_retrieval(question: str, vectorstore=None, k: int = 5) -> List[Dict
     results = []
     for d in docs:
         # гарантуємо, що завжди словник
-        results.append({
-            "page_content": d.page_content,
-            "metadata": d.metadata,
-            "source": d.metadata.get("source") or d.metadata.get("image_url") or ""
-        })
+        results.append(_to_result(d.page_content, d.metadata))
 
     return results
+
+
+def evaluate_retrieval_batch(
+    questions: List[str],
+    vectorstore=None,
+    k: int = 5,
+    backend: str = "chroma"
+) -> List[List[Dict]]:
+    """
+    Batched version of evaluate_retrieval.
+    Embeds all questions in one call and queries the index once for the whole batch.
+    backend="faiss" searches an in-memory FAISS copy of the Chroma vectors instead.
+    """
+    if backend not in ("chroma", "faiss"):
+        raise ValueError(f"Unknown retrieval backend: {backend!r}")
+
+    if not questions:
+        return []
+
+    if vectorstore is None:
+        vectorstore = load_vectorstore()
+
+    if backend == "faiss":
+        faiss_store = faiss_from_chroma(vectorstore)
+        return [
+            [_to_result(d.page_content, d.metadata) for d in docs]
+            for docs in faiss_batch_search(faiss_store, questions, k=k)
+        ]
+
+    query_embeddings = vectorstore._embedding_function.embed_documents(questions)
+    response = vectorstore._collection.query(
+        query_embeddings=query_embeddings,
+        n_results=k,
+        include=["documents", "metadatas"]
+    )
+
+    batch_results = []
+    for documents, metadatas in zip(response["documents"], response["metadatas"]):
+        batch_results.append([
+            _to_result(text, metadata)
+            for text, metadata in zip(documents, metadatas)
+        ])
+
+    return batch_results
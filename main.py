@@ -4,15 +4,55 @@ Options:
 --scrape        : run scraper for images + text
 --build-index   : create embeddings and vectorstore
 --query <text>  : run RAG query
+--query-file    : run RAG queries from a file (one per line)
 """
 
 import argparse
+from typing import List
 
-from src.scraper import run_scraper
-from src.data_loader import load_all_documents
-from src.chunker import chunk_documents
-from src.embeddings import create_vectorstore, load_vectorstore
-from src.rag_pipeline import build_rag_chain, run_rag_query
+# PERF: src modules are imported lazily inside the branches that use them,
+# so e.g. --scrape doesn't pay for torch / chromadb / langchain imports
+
+# RAG chain (holding the vectorstore) is built once per process and reused across queries
+_CHAIN = None
+
+
+def get_rag_chain():
+    global _CHAIN
+
+    if _CHAIN is None:
+        from src.embeddings import load_vectorstore
+        from src.rag_pipeline import build_rag_chain
+
+        print(" Loading vectorstore...")
+        vectorstore = load_vectorstore()
+
+        print(" Building RAG chain...")
+        _CHAIN = build_rag_chain(vectorstore=vectorstore)
+
+    return _CHAIN
+
+
+def query_server(queries: List[str]) -> List[dict]:
+    """
+    Run queries against a single cached vectorstore + RAG chain
+    """
+    from src.rag_pipeline import run_rag_query
+
+    rag_chain = get_rag_chain()
+
+    answers = []
+    for query in queries:
+        print(f" Running RAG query: {query}")
+
+        print(" Running inference...")
+        answer = run_rag_query(rag_chain, query)
+
+        print("\n RAG Response:\n")
+        print(answer)
+        answers.append(answer)
+
+    return answers
 
 
 def main():
@@ -20,16 +60,23 @@ def main():
     parser.add_argument('--scrape', action='store_true', help="Scrape images and text from sources")
     parser.add_argument('--build-index', action='store_true', help="Build vectorstore from scraped data")
     parser.add_argument('--query', type=str, help="Run RAG query")
+    parser.add_argument('--query-file', type=str, help="Run RAG queries from a file (one per line)")
     args = parser.parse_args()
 
 
     if args.scrape:
+        from src.scraper import run_scraper
+
         print(" Running scraper...")
         run_scraper()
         print(" Scraping finished.")
 
 
     if args.build_index:
+        from src.data_loader import load_all_documents
+        from src.chunker import chunk_documents
+        from src.embeddings import create_vectorstore
+
         print(" Loading and chunking documents...")
         all_docs = load_all_documents()  
         chunks = chunk_documents(all_docs)
@@ -38,20 +85,16 @@ def main():
         create_vectorstore(chunks)
         print(" Vectorstore created.")
 
+    queries = []
     if args.query:
-        print(f" Running RAG query: {args.query}")
+        queries.append(args.query)
 
-        print(" Loading vectorstore...")
-        vs = load_vectorstore()
-
-        print(" Building RAG chain...")
-        rag_chain = build_rag_chain(vectorstore=vs)
+    if args.query_file:
+        with open(args.query_file, "r", encoding="utf-8") as f:
+            queries.extend(line.strip() for line in f if line.strip())
 
-        print(" Running inference...")
-        answer = run_rag_query(rag_chain, args.query)
-
-        print("\n RAG Response:\n")
-        print(answer)
+    if queries:
+        query_server(queries)
 
 
 if __name__ == "__main__":
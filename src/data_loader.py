@@ -6,9 +6,11 @@ Responsible for:
 4) Converting raw data into LangChain Document objects
 """
 
-import json
 from typing import List
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import orjson
 
 from langchain_core.documents import Document
 from langchain_community.document_loaders import DirectoryLoader, TextLoader, PyPDFLoader
@@ -16,6 +18,7 @@ from langchain_community.document_loaders import DirectoryLoader, TextLoader, Py
 IMAGE_JSON_PATH = "data/germany_road_signs.json"
 TEXT_DATA_DIR = "data/text_files"
 PDF_DATA_DIR = "data/pdf_files"  
+TEXT_LOADER_CONCURRENCY = 8
 
 
 def load_image_json(json_path: str = IMAGE_JSON_PATH) -> List[Document]:
@@ -23,24 +26,30 @@ def load_image_json(json_path: str = IMAGE_JSON_PATH) -> List[Document]:
     if not json_path.exists():
         raise FileNotFoundError(f"Image JSON not found: {json_path}")
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(json_path, "rb") as f:
+        data = orjson.loads(f.read())
 
-    documents: List[Document] = []
-    for item in data:
-        title = (item.get("title") or "").strip()
-        category = (item.get("category") or "").strip()
-        image_url = (item.get("image_url") or "").strip()
-        page_content = f"Traffic sign: {title}. Category: {category}."
-        metadata = {
-            "type": "image",
-            "title": title,
-            "category": category,
-            "image_url": image_url,
-            "source": "iamexpat.de"
-        }
-        documents.append(Document(page_content=page_content, metadata=metadata))
-    return documents
+    fields = (
+        (
+            (item.get("title") or "").strip(),
+            (item.get("category") or "").strip(),
+            (item.get("image_url") or "").strip(),
+        )
+        for item in data
+    )
+    return [
+        Document(
+            page_content=f"Traffic sign: {title}. Category: {category}.",
+            metadata={
+                "type": "image",
+                "title": title,
+                "category": category,
+                "image_url": image_url,
+                "source": "iamexpat.de"
+            }
+        )
+        for title, category, image_url in fields
+    ]
 
 
 def load_text_files(path: str = TEXT_DATA_DIR) -> List[Document]:
@@ -53,7 +62,9 @@ def load_text_files(path: str = TEXT_DATA_DIR) -> List[Document]:
         glob="**/*.txt",
         loader_cls=TextLoader,
         loader_kwargs={"encoding": "utf-8"},
-        show_progress=True
+        show_progress=True,
+        use_multithreading=True,
+        max_concurrency=TEXT_LOADER_CONCURRENCY
     )
     documents = loader.load()
     for doc in documents:
@@ -62,6 +73,16 @@ def load_text_files(path: str = TEXT_DATA_DIR) -> List[Document]:
     return documents
 
 
+def _load_one_pdf(pdf_file: Path) -> List[Document]:
+    loader = PyPDFLoader(str(pdf_file))
+    pdf_docs = loader.load()
+    # додатково додаємо metadata
+    for doc in pdf_docs:
+        doc.metadata["type"] = "pdf"
+        doc.metadata["source"] = pdf_file.name
+    return pdf_docs
+
+
 def load_pdf_files(path: str = PDF_DATA_DIR) -> List[Document]:
     """
     Load PDF files (e.g., English StVO) and convert to LangChain Documents
@@ -70,14 +91,18 @@ def load_pdf_files(path: str = PDF_DATA_DIR) -> List[Document]:
     if not path.exists():
         raise FileNotFoundError(f"PDF directory not found: {path}")
 
+    pdf_files = sorted(path.glob("*.pdf"))
+
+    # PDF parsing is CPU-bound: parse files in separate processes,
+    # but don't pay process startup for a single file
+    if len(pdf_files) > 1:
+        with ProcessPoolExecutor() as ex:
+            pdf_doc_lists = list(ex.map(_load_one_pdf, pdf_files))
+    else:
+        pdf_doc_lists = [_load_one_pdf(pdf_file) for pdf_file in pdf_files]
+
     documents: List[Document] = []
-    for pdf_file in path.glob("*.pdf"):
-        loader = PyPDFLoader(str(pdf_file))
-        pdf_docs = loader.load()
-        # додатково додаємо metadata
-        for doc in pdf_docs:
-            doc.metadata["type"] = "pdf"
-            doc.metadata["source"] = pdf_file.name
+    for pdf_docs in pdf_doc_lists:
         documents.extend(pdf_docs)
     return documents
 
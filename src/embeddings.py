@@ -7,51 +7,278 @@ Responsible for:
 """
 
 import os
+import uuid
+import sqlite3
+import hashlib
+from functools import lru_cache
 from typing import List, Optional
 
+import numpy as np
 from langchain_core.documents import Document
-from langchain_community.vectorstores import Chroma
+from langchain_community.vectorstores import Chroma, FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_huggingface import HuggingFaceEmbeddings
 
 
 EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L12-v2"
 PERSIST_DIR = "./chroma_db"
+EMBEDDING_BATCH_SIZE = 128
+# Chroma rejects add() calls above its max batch size (~5461)
+CHROMA_ADD_BATCH_SIZE = 5000
 
+# Content-hash → vector cache, kept outside PERSIST_DIR so it survives
+# deleting the vector DB
+EMBEDDING_CACHE_PATH = "./.cache/embedding_cache.sqlite"
+# Stay below SQLite's host-parameter limit in IN (...) lookups
+CACHE_LOOKUP_BATCH_SIZE = 500
 
+# Embeddings are unit-norm, so cosine reduces to a dot product per HNSW neighbor
+COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 64
+}
+
+# FAISS IVF-PQ: 48 sub-quantizers over 384-d MiniLM vectors;
+# PQ training needs enough vectors, smaller corpora keep the exact flat index
+FAISS_PQ_M = 48
+FAISS_IVFPQ_MIN_VECTORS = 10_000
+FAISS_NPROBE = 16
+
+
+def _default_device() -> str:
+    import torch
+
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+@lru_cache(maxsize=4)
 def build_embedding_model(
     model_name: str = EMBEDDING_MODEL_NAME
 ) -> HuggingFaceEmbeddings:
     """
-    Factory for embedding model
+    Factory for embedding model (cached per model name)
     """
     # REVIEW FIX: extracted model creation for reusability & testability
     # REVIEW FIX: replaced deprecated HuggingFaceEmbeddings usage with recommended alternative
-    return HuggingFaceEmbeddings(model_name=model_name)
+    # PERF: lru_cache avoids reloading model weights on every vectorstore build/load
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={"device": _default_device()},
+        encode_kwargs={
+            "batch_size": EMBEDDING_BATCH_SIZE,
+            "normalize_embeddings": True
+        }
+    )
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def embed_with_cache(
+    texts: List[str],
+    embedding_model: HuggingFaceEmbeddings,
+    cache_path: str
+) -> List[List[float]]:
+    """
+    Embed texts, reusing vectors of unchanged content from an on-disk cache
+    """
+    model_name = embedding_model.model_name
+    hashes = [_content_hash(text) for text in texts]
+
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    conn = sqlite3.connect(cache_path)
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (model, hash))"
+        )
+
+        cached = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), CACHE_LOOKUP_BATCH_SIZE):
+            batch = unique_hashes[start:start + CACHE_LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                [model_name, *batch]
+            )
+            for h, blob in rows:
+                cached[h] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+        # embed only content that is not cached yet (deduplicated)
+        missing = {}
+        for h, text in zip(hashes, texts):
+            if h not in cached:
+                missing.setdefault(h, text)
+
+        if missing:
+            vectors = embedding_model.embed_documents(list(missing.values()))
+            for h, vector in zip(missing, vectors):
+                cached[h] = vector
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)",
+                [
+                    (model_name, h, np.asarray(cached[h], dtype=np.float32).tobytes())
+                    for h in missing
+                ]
+            )
+            conn.commit()
+    finally:
+        conn.close()
+
+    reused = sum(1 for h in hashes if h not in missing)
+    print(f"Embedding cache: {reused} reused, {len(texts) - reused} computed")
+
+    return [cached[h] for h in hashes]
 
 
 def build_vectorstore(
     documents: List[Document],
     persist_dir: str = PERSIST_DIR,
-    embedding_model: Optional[HuggingFaceEmbeddings] = None
+    embedding_model: Optional[HuggingFaceEmbeddings] = None,
+    cache_path: str = EMBEDDING_CACHE_PATH
 ) -> Chroma:
     """
     Create and persist vector store
+    Rebuilds replace the existing collection, so repeated builds don't duplicate chunks
     """
     if embedding_model is None:
         embedding_model = build_embedding_model()
 
     os.makedirs(persist_dir, exist_ok=True)
 
+    # PERF: embed all uncached chunks in one batched encode call
+    # (before touching the existing collection, so a failed embed keeps the old index)
+    texts = [doc.page_content for doc in documents]
+    metadatas = [doc.metadata for doc in documents]
+    embeddings = embed_with_cache(texts, embedding_model, cache_path=cache_path) if texts else []
+
     # REVIEW FIX: added explicit persist_directory & embedding_model
-    vectorstore = Chroma.from_documents(
-        documents=documents,
-        embedding=embedding_model,
+    vectorstore = Chroma(
+        embedding_function=embedding_model,
         persist_directory=persist_dir
     )
+    # reset: drop the old collection and recreate it with current HNSW settings
+    vectorstore.delete_collection()
+    vectorstore = Chroma(
+        embedding_function=embedding_model,
+        persist_directory=persist_dir,
+        collection_metadata=COLLECTION_METADATA
+    )
+
+    # bulk-insert directly into the Chroma collection
+    ids = [str(uuid.uuid4()) for _ in texts]
+    for start in range(0, len(texts), CHROMA_ADD_BATCH_SIZE):
+        end = start + CHROMA_ADD_BATCH_SIZE
+        vectorstore._collection.add(
+            ids=ids[start:end],
+            embeddings=embeddings[start:end],
+            documents=texts[start:end],
+            metadatas=metadatas[start:end]
+        )
+
+    return vectorstore
+
+
+def build_faiss_vectorstore(
+    documents: List[Document],
+    embedding_model: Optional[HuggingFaceEmbeddings] = None,
+    embeddings: Optional[List[List[float]]] = None
+) -> FAISS:
+    """
+    Create in-memory FAISS vector store for bulk (batched) retrieval
+    Precomputed `embeddings` (aligned with documents) skip re-embedding
+    Large corpora are re-indexed with IVF-PQ, small ones stay exact
+    """
+    import faiss
+
+    if embedding_model is None:
+        embedding_model = build_embedding_model()
+
+    if embeddings is None:
+        vectorstore = FAISS.from_documents(
+            documents,
+            embedding_model,
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+        )
+    else:
+        vectorstore = FAISS.from_embeddings(
+            list(zip([doc.page_content for doc in documents], embeddings)),
+            embedding_model,
+            metadatas=[doc.metadata for doc in documents],
+            distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+        )
+
+    n_vectors = vectorstore.index.ntotal
+    if n_vectors < FAISS_IVFPQ_MIN_VECTORS:
+        return vectorstore
+
+    vectors = vectorstore.index.reconstruct_n(0, n_vectors)
+    nlist = min(1024, int(np.sqrt(n_vectors)))
+    index = faiss.index_factory(
+        vectors.shape[1],
+        f"IVF{nlist},PQ{FAISS_PQ_M}",
+        faiss.METRIC_INNER_PRODUCT
+    )
+    index.train(vectors)
+    # same insertion order keeps index_to_docstore_id mapping valid
+    index.add(vectors)
+    index.nprobe = FAISS_NPROBE
+    vectorstore.index = index
 
     return vectorstore
 
 
+def faiss_batch_search(
+    vectorstore: FAISS,
+    queries: List[str],
+    k: int = 5
+) -> List[List[Document]]:
+    """
+    Single N x k search call for many queries
+    """
+    if not queries:
+        return []
+
+    query_vectors = np.asarray(
+        vectorstore._embed_documents(queries),
+        dtype=np.float32
+    )
+    _, indices = vectorstore.index.search(query_vectors, k)
+
+    results = []
+    for row in indices:
+        results.append([
+            vectorstore.docstore.search(vectorstore.index_to_docstore_id[i])
+            for i in row
+            if i != -1
+        ])
+    return results
+
+
+def faiss_from_chroma(vectorstore: Chroma) -> FAISS:
+    """
+    Build a FAISS store from the vectors already persisted in Chroma (no re-embedding)
+    """
+    data = vectorstore._collection.get(include=["documents", "metadatas", "embeddings"])
+    documents = [
+        Document(page_content=text, metadata=metadata or {})
+        for text, metadata in zip(data["documents"], data["metadatas"])
+    ]
+    return build_faiss_vectorstore(
+        documents,
+        embedding_model=vectorstore._embedding_function,
+        embeddings=[list(vector) for vector in data["embeddings"]]
+    )
+
+
 def load_vectorstore(
     persist_dir: str = PERSIST_DIR,
     embedding_model: Optional[HuggingFaceEmbeddings] = None
@@ -83,17 +310,27 @@ def build_retriever(
     Build retriever interface
     """
     # REVIEW FIX: made k & search_type configurable for flexibility
-    retriever = vectorstore.as_retriever(
-        search_type=search_type,
-        search_kwargs={"k": k}
-    )
+    # PERF: reuse retriever wrapper per (search_type, k) on the vectorstore
+    cache = getattr(vectorstore, "_cached_retrievers", None)
+    if cache is None:
+        cache = {}
+        vectorstore._cached_retrievers = cache
+
+    retriever = cache.get((search_type, k))
+    if retriever is None:
+        retriever = vectorstore.as_retriever(
+            search_type=search_type,
+            search_kwargs={"k": k}
+        )
+        cache[(search_type, k)] = retriever
 
     return retriever
 
 
 def embed_and_store(
     chunks: List[Document],
-    persist_dir: str = PERSIST_DIR
+    persist_dir: str = PERSIST_DIR,
+    cache_path: str = EMBEDDING_CACHE_PATH
 ) -> Chroma:
     """
     Full pipeline: embedding + persistence
@@ -102,7 +339,8 @@ def embed_and_store(
     vectorstore = build_vectorstore(
         documents=chunks,
         persist_dir=persist_dir,
-        embedding_model=embedding_model
+        embedding_model=embedding_model,
+        cache_path=cache_path
     )
 
     # REVIEW FIX: debug prints for QA / verification
@@ -10,15 +10,21 @@ JSON schema is NOT changed to preserve pipeline compatibility.
 
 import os
 import re
-import json
-import time
+import asyncio
+import math
 import hashlib
+import threading
 import requests
-from typing import List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from urllib.parse import urljoin, urlparse
-from collections import deque
+from urllib.robotparser import RobotFileParser
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 
 
 # --- Sources ---
@@ -33,6 +39,12 @@ START_URLS = [
 ]
 
 BASE_DOMAIN = "www.iamexpat.de"
+CRAWL_PATH_PREFIX = "/expat-info/driving-germany"
+
+_VALID_LINK_PREFIXES = (
+    f"https://{BASE_DOMAIN}{CRAWL_PATH_PREFIX}",
+    f"http://{BASE_DOMAIN}{CRAWL_PATH_PREFIX}",
+)
 
 # --- Paths ---
 IMAGE_JSON_PATH = "data/germany_road_signs.json"
@@ -41,27 +53,98 @@ LOCAL_IMAGE_DIR = "data/images/wiki_signs"
 
 MIN_TEXT_LENGTH = 30
 
+DOWNLOAD_WORKERS = 16
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
+# --- Crawling ---
+CRAWL_CONCURRENCY = 8
+CRAWL_DELAY = 0.3  # min seconds between requests to the same host
+BLOOM_LINKS_PER_PAGE = 10  # expected unique links discovered per crawled page
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 }
 
+# --- Retries (exponential backoff: BACKOFF_FACTOR * 2**attempt seconds) ---
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 1.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_session() -> requests.Session:
+    """Keep-alive session with pooled connections and retries on transient errors"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=("GET",),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
+
+# robots.txt parsers cached per scheme://host
+_robots: Dict[str, RobotFileParser] = {}
+_robots_lock = threading.Lock()
+
+
+def _load_robots(robots_url: str) -> RobotFileParser:
+    rp = RobotFileParser(robots_url)
+    try:
+        r = SESSION.get(robots_url, timeout=30)
+    except requests.RequestException:
+        rp.allow_all = True
+        return rp
+
+    if r.status_code in (401, 403):
+        rp.disallow_all = True
+    elif r.status_code >= 400:
+        rp.allow_all = True
+    else:
+        rp.parse(r.text.splitlines())
+    return rp
+
+
+def is_allowed(url: str) -> bool:
+    """Check robots.txt before fetching; fetched once per host"""
+    parsed = urlparse(url)
+    key = f"{parsed.scheme}://{parsed.netloc}"
+
+    rp = _robots.get(key)
+    if rp is None:
+        with _robots_lock:
+            rp = _robots.get(key)
+            if rp is None:
+                rp = _load_robots(f"{key}/robots.txt")
+                _robots[key] = rp
+
+    return rp.can_fetch(HEADERS["User-Agent"], url)
 
 
 def safe_filename(text: str, ext: str = ".png") -> str:
-    base = re.sub(r"[^a-zA-Z0-9_-]", "_", text.lower()).strip("_")
+    base = _SANITIZE_RE.sub("_", text.lower()).strip("_")
     if not base:
-        base = hashlib.md5(text.encode()).hexdigest()[:12]
+        base = hashlib.blake2b(text.encode(), digest_size=6).hexdigest()
     return base + ext
 
 
 def download_image(url: str, title: str) -> str:
     """Download image locally and return local path"""
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=30)
-        r.raise_for_status()
-    except requests.RequestException:
-        return ""
-
     os.makedirs(LOCAL_IMAGE_DIR, exist_ok=True)
 
     ext = os.path.splitext(urlparse(url).path)[1]
@@ -71,8 +154,28 @@ def download_image(url: str, title: str) -> str:
     filename = safe_filename(title, ext)
     local_path = os.path.join(LOCAL_IMAGE_DIR, filename)
 
-    with open(local_path, "wb") as f:
-        f.write(r.content)
+    # resume: filenames are deterministic, skip images already on disk
+    if os.path.exists(local_path) and os.path.getsize(local_path) > 0:
+        return local_path
+
+    if not is_allowed(url):
+        return ""
+
+    # write to a temp file first: parallel downloads may share a title/filename
+    tmp_path = f"{local_path}.{threading.get_ident()}.part"
+    try:
+        # stream to disk in chunks instead of buffering the whole body
+        with SESSION.get(url, timeout=30, stream=True) as r:
+            r.raise_for_status()
+            with open(tmp_path, "wb") as f:
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+    except requests.RequestException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return ""
+
+    os.replace(tmp_path, local_path)
 
     return local_path
 
@@ -82,27 +185,31 @@ def clean_filename(url: str) -> str:
     if not path:
         return "index.txt"
     name = path.split("/")[-1]
-    return re.sub(r"[^a-zA-Z0-9_-]", "_", name) + ".txt"
+    return _SANITIZE_RE.sub("_", name) + ".txt"
 
 
 
-def extract_text(soup: BeautifulSoup) -> str:
-    content: List[str] = []
-
-    for tag in soup.find_all(["h1", "h2", "h3", "p", "li"]):
-        text = tag.get_text(" ", strip=True)
+def iter_text_blocks(tree: LexborHTMLParser) -> Iterator[str]:
+    for node in tree.css("h1, h2, h3, p, li"):
+        # collapse whitespace left by empty inline text nodes
+        text = " ".join(node.text(separator=" ", strip=True).split())
         if len(text) > MIN_TEXT_LENGTH:
-            content.append(text)
+            yield text
+
 
-    return "\n\n".join(content)
+def write_text_blocks(fh: TextIO, blocks: Iterable[str]):
+    """Write blocks separated by blank lines"""
+    first = True
+    for block in blocks:
+        if not first:
+            fh.write("\n\n")
+        fh.write(block)
+        first = False
 
 
 def is_valid_link(link: str) -> bool:
-    parsed = urlparse(link)
-    return (
-        parsed.netloc == BASE_DOMAIN
-        and parsed.path.startswith("/expat-info/driving-germany")
-    )
+    # links are absolute (urljoin), so a prefix check replaces urlparse
+    return link.startswith(_VALID_LINK_PREFIXES)
 
 
 
@@ -110,23 +217,29 @@ def scrape_wikipedia_signs(output_path: str = IMAGE_JSON_PATH):
     print(f"Connecting to Wikipedia: {WIKI_SIGNS_URL}")
 
     try:
-        response = requests.get(WIKI_SIGNS_URL, headers=HEADERS, timeout=30)
+        response = SESSION.get(WIKI_SIGNS_URL, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         raise RuntimeError(f"Failed to load Wikipedia page: {e}")
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    tree = LexborHTMLParser(response.content)
 
-    content = soup.find("div", id="mw-content-text")
+    content = tree.css_first("div#mw-content-text")
+    if content is None:
+        raise RuntimeError("Wikipedia page has no content container")
 
     all_data = []
 
-    # Wikipedia uses tables + galleries
-    images = content.find_all("img")
+    # Wikipedia uses tables + galleries.
+    # Single document-order pass: track the last h2/h3 as the image category
+    category = "General"
+    for node in content.css("h2, h3, img"):
+        if node.tag != "img":
+            category = node.text(strip=True)
+            continue
 
-    for img in images:
-        src = img.get("src", "")
-        alt = img.get("alt", "").strip()
+        src = node.attributes.get("src") or ""
+        alt = (node.attributes.get("alt") or "").strip()
 
         if not src:
             continue
@@ -141,15 +254,6 @@ def scrape_wikipedia_signs(output_path: str = IMAGE_JSON_PATH):
 
         title = alt if alt else "German road sign"
 
-        # Category from nearest header
-        category = "General"
-        prev_h = img.find_previous(["h2", "h3"])
-        if prev_h:
-            category = prev_h.get_text(strip=True)
-
-        # download locally
-        local_path = download_image(img_url, title)
-
         all_data.append({
             "category": category,
             "title": title,
@@ -159,60 +263,260 @@ def scrape_wikipedia_signs(output_path: str = IMAGE_JSON_PATH):
 
     # deduplicate by image_url
     seen: Set[str] = set()
-    unique_data = [
-        item for item in all_data
-        if item["image_url"] not in seen and not seen.add(item["image_url"])
-    ]
+    unique_data = []
+    for item in all_data:
+        image_url = item["image_url"]
+        if image_url not in seen:
+            seen.add(image_url)
+            unique_data.append(item)
+
+    # download locally, in parallel (pure I/O, shared SESSION connection pool)
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        list(ex.map(
+            lambda item: download_image(item["image_url"], item["title"]),
+            unique_data
+        ))
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(unique_data, f, indent=2, ensure_ascii=False)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(unique_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     print(f"{len(unique_data)} Wikipedia road signs collected")
     print(f"Images saved locally in: {LOCAL_IMAGE_DIR}")
 
 
-class PageCrawler:
-    def __init__(self, output_dir: str):
-        self.visited: Set[str] = set()
-        self.output_dir = output_dir
-        os.makedirs(self.output_dir, exist_ok=True)
-
-    def crawl(self, start_urls: List[str], max_pages: int = 200):
-        queue = deque(start_urls)
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds (HTTP-date form is ignored)"""
+    if value and value.strip().isdigit():
+        return float(value.strip())
+    return None
 
-        while queue and len(self.visited) < max_pages:
-            url = queue.popleft()
 
-            if url in self.visited:
-                continue
+def _write_text_file(filepath: str, blocks: List[str]):
+    # write block by block instead of joining the page into one more string
+    with open(filepath, "w", encoding="utf-8") as f:
+        write_text_blocks(f, blocks)
 
-            print(f"Processing: {url}")
-            self.visited.add(url)
 
-            try:
-                r = requests.get(url, headers=HEADERS, timeout=30)
-                r.raise_for_status()
-            except requests.RequestException:
-                continue
+def parse_page(url: str, html: bytes) -> Tuple[List[str], List[str]]:
+    """Parse crawled page into (text blocks, valid absolute links)"""
+    tree = LexborHTMLParser(html)
 
-            soup = BeautifulSoup(r.text, "html.parser")
+    # materialized: blocks are handed to the writer coroutine after parsing,
+    # so peak memory is still proportional to the page text
+    blocks = list(iter_text_blocks(tree))
 
-            text = extract_text(soup)
-            if text:
-                filename = clean_filename(url)
-                filepath = os.path.join(self.output_dir, filename)
+    links = []
+    for a in tree.css("a[href]"):
+        try:
+            link = urljoin(url, a.attributes["href"])
+        except ValueError:
+            # malformed href (e.g. broken IPv6 host) - skip the link, keep the page
+            continue
+        if is_valid_link(link):
+            links.append(link)
+
+    return blocks, links
+
+
+class BloomFilter:
+    """
+    Compact approximate set for crawled URLs.
+    False positives (skipping a never-visited page) are possible, false negatives are not.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        new = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
 
-                with open(filepath, "w", encoding="utf-8") as f:
-                    f.write(text)
 
-            for a in soup.find_all("a", href=True):
-                link = urljoin(url, a["href"])
-                if is_valid_link(link) and link not in self.visited:
-                    queue.append(link)
+class PageCrawler:
+    def __init__(
+        self,
+        output_dir: str,
+        concurrency: int = CRAWL_CONCURRENCY,
+        delay: float = CRAWL_DELAY,
+        use_bloom: bool = False
+    ):
+        self.visited: Set[str] = set()
+        self._enqueued: Set[str] = set()
+        self.use_bloom = use_bloom
+        self.output_dir = output_dir
+        self.concurrency = concurrency
+        self.delay = delay
+        self._last_request: Dict[str, float] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        os.makedirs(self.output_dir, exist_ok=True)
 
-            time.sleep(0.3)  # polite crawling
+    async def _throttle(self, url: str):
+        """Polite crawling: keep at least `delay` seconds between requests per host"""
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            loop = asyncio.get_running_loop()
+            # re-check after sleeping: _backoff may have pushed the slot back meanwhile
+            while (wait := self._last_request.get(host, 0.0) + self.delay - loop.time()) > 0:
+                await asyncio.sleep(wait)
+            self._last_request[host] = loop.time()
+
+    async def _allowed(self, url: str) -> bool:
+        # robots.txt is fetched (blocking) only on the first URL of a host
+        parsed = urlparse(url)
+        if f"{parsed.scheme}://{parsed.netloc}" in _robots:
+            return is_allowed(url)
+        return await asyncio.to_thread(is_allowed, url)
+
+    def _backoff(self, url: str, seconds: float):
+        """Push back the next allowed request to this host"""
+        host = urlparse(url).netloc
+        next_request = asyncio.get_running_loop().time() + seconds - self.delay
+        self._last_request[host] = max(self._last_request.get(host, 0.0), next_request)
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        for attempt in range(MAX_RETRIES + 1):
+            await self._throttle(url)
+            backoff = BACKOFF_FACTOR * 2 ** attempt
+            try:
+                async with session.get(url) as r:
+                    if r.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        retry_after = _parse_retry_after(r.headers.get("Retry-After"))
+                        self._backoff(url, retry_after if retry_after is not None else backoff)
+                        continue
+                    r.raise_for_status()
+                    return await r.read()
+            except aiohttp.ClientResponseError:
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    return None
+                self._backoff(url, backoff)
+
+        return None
+
+    async def _writer(self, write_queue: asyncio.Queue):
+        """Single writer: file I/O runs in a thread, off the event loop"""
+        while True:
+            filepath, blocks = await write_queue.get()
+            if filepath is None:
+                break
+            try:
+                await asyncio.to_thread(_write_text_file, filepath, blocks)
+            except OSError as e:
+                print(f"Failed to write {filepath}: {e}")
+
+    async def _worker(
+        self,
+        session: aiohttp.ClientSession,
+        queue: asyncio.Queue,
+        write_queue: asyncio.Queue,
+        max_pages: int
+    ):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            url = await queue.get()
+            try:
+                # queue holds unseen URLs only (checked before enqueue)
+                if len(self.visited) >= max_pages:
+                    continue
+
+                print(f"Processing: {url}")
+                self.visited.add(url)
+
+                if not await self._allowed(url):
+                    continue
+
+                html = await self._fetch(session, url)
+                if html is None:
+                    continue
+
+                # parse off the event loop so it doesn't block other fetches
+                blocks, links = await loop.run_in_executor(None, parse_page, url, html)
+
+                if blocks:
+                    filename = clean_filename(url)
+                    filepath = os.path.join(self.output_dir, filename)
+                    await write_queue.put((filepath, blocks))
+
+                for link in links:
+                    if link not in self._enqueued:
+                        self._enqueued.add(link)
+                        queue.put_nowait(link)
+            except Exception as e:
+                # one bad page must not kill the worker (queue.join would hang)
+                print(f"Failed: {url} ({type(e).__name__}: {e})")
+            finally:
+                queue.task_done()
+
+    async def crawl(self, start_urls: List[str], max_pages: int = 200):
+        if self.use_bloom:
+            # opt-in: ~15 bits per URL instead of full strings for large crawls
+            self.visited = BloomFilter(capacity=max_pages)
+            self._enqueued = BloomFilter(capacity=max_pages * BLOOM_LINKS_PER_PAGE)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for url in start_urls:
+            if url not in self._enqueued:
+                self._enqueued.add(url)
+                queue.put_nowait(url)
+
+        connector = aiohttp.TCPConnector(limit=16, limit_per_host=4)
+        timeout = aiohttp.ClientTimeout(total=30)
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=HEADERS,
+            timeout=timeout
+        ) as session:
+            write_queue: asyncio.Queue = asyncio.Queue()
+            writer = asyncio.create_task(self._writer(write_queue))
+
+            workers = [
+                asyncio.create_task(self._worker(session, queue, write_queue, max_pages))
+                for _ in range(self.concurrency)
+            ]
+
+            await queue.join()
+
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # sentinel: flush pending writes and stop the writer
+            await write_queue.put((None, None))
+            await writer
 
 
 def run_scraper():
@@ -221,9 +525,12 @@ def run_scraper():
 
     print("\n--- SCRAPING IAMEXPAT TEXTS ---")
     crawler = PageCrawler(TEXT_OUTPUT_DIR)
-    crawler.crawl(START_URLS)
+    asyncio.run(crawler.crawl(START_URLS))
+
+    with os.scandir(TEXT_OUTPUT_DIR) as it:
+        text_count = sum(1 for entry in it if entry.is_file())
 
-    print(f"\nTexts saved: {len(os.listdir(TEXT_OUTPUT_DIR))}")
+    print(f"\nTexts saved: {text_count}")
     print("\nPipeline data collection finished successfully ")
 
 
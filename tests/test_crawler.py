@@ -0,0 +1,165 @@
+import io
+import os
+import asyncio
+
+from src.scraper import BloomFilter, PageCrawler, is_valid_link, write_text_blocks
+
+
+def test_bloom_filter_membership():
+    bloom = BloomFilter(capacity=1000)
+    urls = [f"https://www.iamexpat.de/expat-info/driving-germany/page-{i}" for i in range(1000)]
+
+    for url in urls:
+        bloom.add(url)
+    bloom.add(urls[0])
+
+    assert all(url in bloom for url in urls)
+    assert len(bloom) <= len(urls)
+
+    false_positives = sum(
+        f"https://www.iamexpat.de/other-{i}" in bloom for i in range(1000)
+    )
+    assert false_positives < 20
+
+
+def test_is_valid_link():
+    assert is_valid_link("https://www.iamexpat.de/expat-info/driving-germany/road-signs")
+    assert is_valid_link("http://www.iamexpat.de/expat-info/driving-germany")
+    assert not is_valid_link("https://www.iamexpat.de/housing/rent")
+    assert not is_valid_link("https://iamexpat.de/expat-info/driving-germany")
+    assert not is_valid_link("mailto:info@iamexpat.de")
+
+
+def test_write_text_blocks():
+    fh = io.StringIO()
+    write_text_blocks(fh, ["first block", "second block"])
+    assert fh.getvalue() == "first block\n\nsecond block"
+
+    empty = io.StringIO()
+    write_text_blocks(empty, [])
+    assert empty.getvalue() == ""
+
+
+BASE = "https://www.iamexpat.de/expat-info/driving-germany"
+PARAGRAPH = "<p>A paragraph long enough to pass the minimum text length filter.</p>"
+
+
+def run_stubbed_crawl(tmp_path, pages, start_urls, max_pages=200):
+    """Crawl with network calls stubbed: pages maps url -> html bytes or Exception"""
+    crawler = PageCrawler(str(tmp_path), concurrency=2, delay=0)
+    fetched = []
+
+    async def fake_allowed(url):
+        return True
+
+    async def fake_fetch(session, url):
+        fetched.append(url)
+        page = pages.get(url)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    crawler._allowed = fake_allowed
+    crawler._fetch = fake_fetch
+
+    asyncio.run(asyncio.wait_for(crawler.crawl(start_urls, max_pages=max_pages), timeout=5))
+    return crawler, fetched
+
+
+def test_crawl_dedups_links_and_survives_bad_pages(tmp_path):
+    links = f'<a href="{BASE}/b">b</a><a href="{BASE}/c">c</a><a href="{BASE}/a">a</a>'
+    pages = {
+        f"{BASE}/a": f"{PARAGRAPH}{links}<a href='http://[bad'>x</a>".encode(),
+        f"{BASE}/b": f"{PARAGRAPH}{links}".encode(),
+        f"{BASE}/c": RuntimeError("boom"),
+    }
+
+    crawler, fetched = run_stubbed_crawl(tmp_path, pages, [f"{BASE}/a", f"{BASE}/a"])
+
+    # every URL is fetched exactly once despite repeated links and seeds
+    assert sorted(fetched) == [f"{BASE}/a", f"{BASE}/b", f"{BASE}/c"]
+    # writer sentinel flushed all pending writes before crawl returned
+    assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.txt"]
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8").startswith("A paragraph")
+
+
+def test_crawl_stops_at_max_pages(tmp_path):
+    pages = {
+        f"{BASE}/{i}": f'{PARAGRAPH}<a href="{BASE}/{i + 1}">next</a>'.encode()
+        for i in range(10)
+    }
+
+    crawler, fetched = run_stubbed_crawl(tmp_path, pages, [f"{BASE}/0"], max_pages=3)
+
+    assert len(crawler.visited) == 3
+    assert fetched == [f"{BASE}/0", f"{BASE}/1", f"{BASE}/2"]
+
+
+class StubResponse:
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class StubSession:
+    """Replays canned responses in order and records when each request went out"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.request_times = []
+
+    def get(self, url):
+        self.request_times.append(asyncio.get_running_loop().time())
+        return self.responses.pop(0)
+
+
+def test_fetch_retries_429_after_retry_after(tmp_path):
+    crawler = PageCrawler(str(tmp_path), delay=0)
+    session = StubSession([
+        StubResponse(429, {"Retry-After": "1"}),
+        StubResponse(200, body=b"<p>ok</p>"),
+    ])
+
+    body = asyncio.run(crawler._fetch(session, f"{BASE}/a"))
+
+    assert body == b"<p>ok</p>"
+    assert len(session.request_times) == 2
+    assert session.request_times[1] - session.request_times[0] >= 0.9
+
+
+def test_backoff_during_throttle_sleep_is_not_overwritten(tmp_path):
+    crawler = PageCrawler(str(tmp_path), delay=0.05)
+    url = f"{BASE}/a"
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        slots = []
+
+        async def request(backoff=None):
+            await crawler._throttle(url)
+            slots.append(loop.time())
+            if backoff:
+                # 429 arrives while the next worker is sleeping inside _throttle
+                await asyncio.sleep(0.02)
+                crawler._backoff(url, backoff)
+
+        await asyncio.gather(request(backoff=0.5), request(), request())
+        return slots
+
+    slots = asyncio.run(run())
+
+    assert slots[1] - slots[0] >= 0.45
+    assert slots[2] - slots[1] >= 0.04
@@ -4,11 +4,19 @@ import time
 import gc
 import pytest
 from langchain_core.documents import Document
-from src.embeddings import embed_and_store, load_vectorstore
+from langchain_core.embeddings import Embeddings
+from src.embeddings import (
+    embed_and_store,
+    embed_with_cache,
+    build_vectorstore,
+    load_vectorstore,
+    build_faiss_vectorstore,
+    faiss_batch_search
+)
 
 TEST_DB_DIR = "./test_chroma_db"
 
-def test_embedding_pipeline():
+def test_embedding_pipeline(tmp_path):
     """
     Test the full embedding pipeline:
     - Embed minimal documents
@@ -32,7 +40,11 @@ def test_embedding_pipeline():
         )
     ]
 
-    vectorstore = embed_and_store(docs, persist_dir=TEST_DB_DIR)
+    vectorstore = embed_and_store(
+        docs,
+        persist_dir=TEST_DB_DIR,
+        cache_path=str(tmp_path / "embedding_cache.sqlite")
+    )
 
     assert vectorstore is not None
     assert vectorstore._collection.count() == len(docs)
@@ -45,3 +57,94 @@ def test_embedding_pipeline():
     gc.collect()                 
     time.sleep(0.5)              
     shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
+
+
+class KeywordEmbeddings(Embeddings):
+    """One-hot embedder over a tiny vocabulary, so FAISS ranking is predictable"""
+
+    VOCAB = ["stop", "yield", "speed", "parking"]
+
+    def embed_documents(self, texts):
+        return [[float(word in text.lower()) for word in self.VOCAB] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def test_faiss_batch_search_returns_k_docs_per_query_in_order():
+    pytest.importorskip("faiss")
+
+    docs = [
+        Document(page_content="Stop sign", metadata={"source": "stop"}),
+        Document(page_content="Yield sign", metadata={"source": "yield"}),
+        Document(page_content="Speed limit sign", metadata={"source": "speed"}),
+        Document(page_content="Parking sign", metadata={"source": "parking"}),
+    ]
+    vectorstore = build_faiss_vectorstore(docs, embedding_model=KeywordEmbeddings())
+
+    # small corpus keeps the exact flat index
+    assert vectorstore.index.ntotal == len(docs)
+    assert "IVF" not in type(vectorstore.index).__name__
+
+    results = faiss_batch_search(vectorstore, ["parking", "stop", "speed"], k=2)
+
+    assert len(results) == 3
+    assert all(len(hits) == 2 for hits in results)
+    assert [hits[0].metadata["source"] for hits in results] == ["parking", "stop", "speed"]
+
+
+class CountingEmbeddings(Embeddings):
+    """Deterministic embedder that records every text it is asked to embed"""
+
+    model_name = "counting-stub"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        # halves are exact in float32, so cached vectors must round-trip bit for bit
+        return [[len(text) / 2, (sum(map(ord, text)) % 97) / 2, 1.0] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def test_embed_with_cache_reuses_unchanged_texts(tmp_path):
+    cache_path = str(tmp_path / "cache" / "embeddings.sqlite")
+    embedder = CountingEmbeddings()
+
+    # > CACHE_LOOKUP_BATCH_SIZE unique texts, plus duplicates
+    texts = [f"chunk {i}" for i in range(600)] + ["chunk 1", "chunk 2"]
+    first = embed_with_cache(texts, embedder, cache_path=cache_path)
+
+    assert len(embedder.calls) == 1
+    assert len(embedder.calls[0]) == 600
+    assert first == CountingEmbeddings().embed_documents(texts)
+
+    changed = list(texts)
+    changed[10] = "chunk 10 (edited)"
+    changed.append("brand new chunk")
+    second = embed_with_cache(changed, embedder, cache_path=cache_path)
+
+    assert embedder.calls[1] == ["chunk 10 (edited)", "brand new chunk"]
+    assert second == CountingEmbeddings().embed_documents(changed)
+
+
+def test_build_vectorstore_rebuild_does_not_duplicate(tmp_path):
+    pytest.importorskip("chromadb")
+
+    docs = [
+        Document(page_content=f"Traffic sign {i}", metadata={"source": f"sign-{i}"})
+        for i in range(5)
+    ]
+    kwargs = dict(
+        persist_dir=str(tmp_path / "chroma"),
+        embedding_model=CountingEmbeddings(),
+        cache_path=str(tmp_path / "embeddings.sqlite")
+    )
+
+    build_vectorstore(docs, **kwargs)
+    vectorstore = build_vectorstore(docs, **kwargs)
+
+    assert vectorstore._collection.count() == len(docs)
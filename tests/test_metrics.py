@@ -0,0 +1,47 @@
+import pytest
+from evaluation.metrics import (
+    normalize,
+    compute_retrieval_metrics,
+    compute_answer_metrics,
+    compute_answer_similarities
+)
+
+
+class FakeEmbedder:
+    """Deterministic bag-of-letters embedder for metric tests"""
+
+    def embed_documents(self, texts):
+        return [
+            [text.lower().count(ch) for ch in "abcdefghijklmnopqrstuvwxyz"]
+            for text in texts
+        ]
+
+
+def test_answer_similarities_batch():
+    embedder = FakeEmbedder()
+    scores = compute_answer_similarities(
+        ["slippery road ahead", "", "anything"],
+        ["slippery road ahead", "slippery road", ""],
+        embedder
+    )
+
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[1] == 0.0
+    assert scores[2] == 1.0
+
+
+def test_answer_metrics_token_fallback():
+    score = compute_answer_metrics("The road is slippery!", "slippery road")
+    assert score == 1.0
+
+
+def test_normalize_strips_non_ascii_and_punctuation():
+    assert normalize("  Straße: No Entry! 267 ") == "strae no entry 267"
+
+
+def test_retrieval_metrics_partial_hits():
+    retrieved = [{"source": "StVO.pdf"}, {"image_url": "https://upload.wikimedia.org/a.png"}]
+    score = compute_retrieval_metrics(retrieved, ["StVO.pdf", "iamexpat.de"])
+
+    assert score == 0.5
+    assert compute_retrieval_metrics([], ["StVO.pdf"]) == 0.0
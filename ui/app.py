@@ -1,13 +1,17 @@
 import streamlit as st
+import os
 import sys
 from pathlib import Path
 
+# Avoid tokenizers fork warnings (set before transformers is imported)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
 # Add project root to path
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
-from src.rag_pipeline import build_rag_chain, run_rag_query
+# Heavy backend modules (langchain, torch, chromadb) are imported lazily
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -41,6 +45,7 @@ st.markdown("""
 def load_backend():
     # Lazy import to speed up initial load
     from src.embeddings import load_vectorstore
+    from src.rag_pipeline import build_rag_chain
     try:
         vectorstore = load_vectorstore()
         rag_chain = build_rag_chain(vectorstore=vectorstore)
@@ -49,8 +54,6 @@ def load_backend():
         st.error(f"Error loading database: {e}")
         return None
 
-rag_chain = load_backend()
-
 # --- Header ---
 st.title("🚦 SmartSign RAG Assistant")
 st.markdown("### Your personal guide to German road signs")
@@ -75,13 +78,19 @@ if search_button:
         st.warning("Please enter a question.")
     else:
         with st.spinner("Analyzing database and generating response..."):
-            try:
-                # Execute RAG query
-                result = run_rag_query(rag_chain, query)
-                # Store in session state to persist through UI interactions
-                st.session_state["result"] = result
-            except Exception as e:
-                st.error(f"An error occurred: {e}")
+            # Backend loads on first search (cached afterwards),
+            # so the page renders before the heavy imports
+            rag_chain = load_backend()
+            if rag_chain is not None:
+                try:
+                    from src.rag_pipeline import run_rag_query
+
+                    # Execute RAG query
+                    result = run_rag_query(rag_chain, query)
+                    # Store in session state to persist through UI interactions
+                    st.session_state["result"] = result
+                except Exception as e:
+                    st.error(f"An error occurred: {e}")
 
 # --- Output Display ---
 if "result" in st.session_state: